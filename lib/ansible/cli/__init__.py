@@ -278,10 +278,12 @@ class CLI(with_metaclass(ABCMeta, object)):
 
     @staticmethod
     def unfrack_paths(option, opt, value, parser):
+        # empty entries (ie. a trailing separator) would otherwise be
+        # unfracked into the current working directory
         if isinstance(value, string_types):
-            setattr(parser.values, option.dest, [unfrackpath(x) for x in value.split(os.pathsep)])
+            setattr(parser.values, option.dest, [unfrackpath(x) for x in value.split(os.pathsep) if x])
         elif isinstance(value, list):
-            setattr(parser.values, option.dest, [unfrackpath(x) for x in value])
+            setattr(parser.values, option.dest, [unfrackpath(x) for x in value if x])
         else:
             pass  # FIXME: should we raise options error?
 
@@ -312,7 +314,7 @@ class CLI(with_metaclass(ABCMeta, object)):
         if module_opts:
             parser.add_option('-M', '--module-path', dest='module_path', default=None,
                               help="prepend path(s) to module library (default=%s)" % C.DEFAULT_MODULE_PATH,
-                              action="callback", callback=CLI.unfrack_path, type='str')
+                              action="callback", callback=CLI.unfrack_paths, type='str')
         if runtask_opts:
             parser.add_option('-e', '--extra-vars', dest="extra_vars", action="append",
                               help="set additional variables as key=value or YAML/JSON, if filename prepend with @", default=[])
@@ -126,8 +126,8 @@ class ConsoleCLI(CLI, cmd.Cmd):
     def list_modules(self):
         modules = set()
         if self.options.module_path is not None:
-            for i in self.options.module_path.split(os.pathsep):
-                module_loader.add_directory(i)
+            for path in self.options.module_path:
+                module_loader.add_directory(path)
 
         module_paths = module_loader._get_paths()
         for path in module_paths:
@@ -96,8 +96,8 @@ class DocCLI(CLI):
 
         # add to plugin path from command line
         if self.options.module_path is not None:
-            for i in self.options.module_path.split(os.pathsep):
-                loader.add_directory(i)
+            for path in self.options.module_path:
+                loader.add_directory(path)
 
         # list plugins for type
         if self.options.list_dir:
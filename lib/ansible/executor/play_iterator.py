@@ -170,6 +170,19 @@ class PlayIterator:
         if self._play.fact_path is not None:
             fact_path = self._play.fact_path
 
+        # Gather facts if the default is 'smart' and we have not yet
+        # done it for this host; or if 'explicit' and the play sets
+        # gather_facts to True; or if 'implicit' and the play does
+        # NOT explicitly set gather_facts to False. Only the 'smart'
+        # policy depends on the host, so the rest is decided once here
+        # rather than every time a host's next task is looked up.
+        gathering = C.DEFAULT_GATHERING
+        implied = self._play.gather_facts is None or boolean(self._play.gather_facts)
+        self._gather_facts = (gathering == 'implicit' and implied) or \
+                             (gathering == 'explicit' and boolean(self._play.gather_facts)) or \
+                             (gathering == 'smart' and implied)
+        self._gather_facts_smart = (gathering == 'smart')
+
         setup_block = Block(play=self._play)
         setup_task = Task(block=setup_block)
         setup_task.action = 'setup'
@@ -267,8 +280,11 @@ class PlayIterator:
             self._host_states[host.name] = s
 
         display.debug("done getting next task for host %s" % host.name)
-        display.debug(" ^ task is: %s" % task)
-        display.debug(" ^ state is: %s" % s)
+        if C.DEFAULT_DEBUG:
+            # rendering the (nested) host state is expensive, so only do it
+            # when the message will actually be displayed
+            display.debug(" ^ task is: %s" % task)
+            display.debug(" ^ state is: %s" % s)
         return (s, task)
 
     def _get_next_task_from_state(self, state, host, peek, in_child=False):
@@ -294,17 +310,10 @@ class PlayIterator:
                 if not state.pending_setup:
                     state.pending_setup = True
 
-                    # Gather facts if the default is 'smart' and we have not yet
-                    # done it for this host; or if 'explicit' and the play sets
-                    # gather_facts to True; or if 'implicit' and the play does
-                    # NOT explicitly set gather_facts to False.
-
-                    gathering = C.DEFAULT_GATHERING
-                    implied = self._play.gather_facts is None or boolean(self._play.gather_facts)
-
-                    if (gathering == 'implicit' and implied) or \
-                       (gathering == 'explicit' and boolean(self._play.gather_facts)) or \
-                       (gathering == 'smart' and implied and not (self._variable_manager._fact_cache.get(host.name, {}).get('module_setup', False))):
+                    # see __init__ for when facts are gathered, with 'smart' gathering
+                    # we skip hosts which already have facts in the fact cache
+                    if self._gather_facts and \
+                       not (self._gather_facts_smart and self._variable_manager._fact_cache.get(host.name, {}).get('module_setup', False)):
                         # The setup block is always self._blocks[0], as we inject it
                         # during the play compilation in __init__ above.
                         setup_block = self._blocks[0]
@@ -187,8 +187,8 @@ class PlaybookExecutor:
                 # send the stats callback for this playbook
                 if self._tqm is not None:
                     if C.RETRY_FILES_ENABLED:
-                        retries = set(self._tqm._failed_hosts.keys())
-                        retries.update(self._tqm._unreachable_hosts.keys())
+                        retries = set(self._tqm._failed_hosts)
+                        retries.update(self._tqm._unreachable_hosts)
                         retries = sorted(retries)
                         if len(retries) > 0:
                             if C.RETRY_FILES_SAVE_PATH:
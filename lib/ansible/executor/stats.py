@@ -43,8 +43,8 @@ class AggregateStats:
         ''' helper function to bump a statistic '''
 
         self.processed[host] = 1
-        prev = (getattr(self, what)).get(host, 0)
-        getattr(self, what)[host] = prev + 1
+        stat = getattr(self, what)
+        stat[host] = stat.get(host, 0) + 1
 
     def summarize(self, host):
         ''' return information about a particular host '''
@@ -116,7 +116,7 @@ class TaskExecutor:
                                 res[array] = res[array] + item[array]
                                 del item[array]
 
-                    if not res.get('Failed', False):
+                    if not res.get('failed', False):
                         res['msg'] = 'All items completed'
                 else:
                     res = dict(changed=False, skipped=True, skipped_reason='No items in the list', results=[])
@@ -321,6 +321,13 @@ class TaskExecutor:
         (typically package management modules).
         '''
         name = None
+
+        # only squashable or templated actions (which may turn out to be
+        # squashable) are worth building a templar for
+        task_action = self._task.action
+        if not items or (task_action not in self.SQUASH_ACTIONS and '{' not in task_action):
+            return items
+
         try:
             # _task.action could contain templatable strings (via action: and
             # local_action:)  Template it before comparing.  If we don't end up
@@ -328,11 +335,10 @@ class TaskExecutor:
             # that aren't available until later (it could even use vars from the
             # with_items loop) so don't make the templated string permanent yet.
             templar = Templar(loader=self._loader, shared_loader_obj=self._shared_loader_obj, variables=variables)
-            task_action = self._task.action
             if templar._contains_vars(task_action):
                 task_action = templar.template(task_action, fail_on_undefined=False)
 
-            if len(items) > 0 and task_action in self.SQUASH_ACTIONS:
+            if task_action in self.SQUASH_ACTIONS:
                 if all(isinstance(o, string_types) for o in items):
                     final_items = []
 
@@ -667,18 +673,27 @@ class TaskExecutor:
             shared_loader_obj=self._shared_loader_obj,
         )
 
+        # Check the job right away and only sleep while it is still running,
+        # so short-lived jobs are not held back by a full poll interval, and
+        # never sleep past the async deadline.
+        async_result = {}
         time_left = self._task.async
-        while time_left > 0:
-            time.sleep(self._task.poll)
-
+        slept = False
+        while True:
             try:
                 async_result = normal_handler.run(task_vars=task_vars)
+                # async_wrapper writes the job status file from a daemonized
+                # child after the task has returned, so a check made before the
+                # first poll interval may not find it yet. Only trust a missing
+                # job once we have waited for it at least once.
+                if not slept and async_result.get('msg') == 'could not find job':
+                    pass
                 # We do not bail out of the loop in cases where the failure
                 # is associated with a parsing error. The async_runner can
                 # have issues which result in a half-written/unparseable result
                 # file on disk, which manifests to the user as a timeout happening
                 # before it's time to timeout.
-                if (int(async_result.get('finished', 0)) == 1 or
+                elif (int(async_result.get('finished', 0)) == 1 or
                         ('failed' in async_result and async_result.get('_ansible_parsed', False)) or
                         'skipped' in async_result):
                     break
@@ -687,13 +702,20 @@ class TaskExecutor:
                 # On an exception, call the connection's reset method if it has one
                 # (eg, drop/recreate WinRM connection; some reused connections are in a broken state)
                 display.vvvv("Exception during async poll, retrying... (%s)" % to_text(e))
-                display.debug("Async poll exception was:\n%s" % to_text(traceback.format_exc()))
+                if C.DEFAULT_DEBUG:
+                    display.debug("Async poll exception was:\n%s" % to_text(traceback.format_exc()))
                 try:
                     normal_handler._connection._reset()
                 except AttributeError:
                     pass
 
-            time_left -= self._task.poll
+            if time_left <= 0:
+                break
+
+            delay = min(self._task.poll, time_left)
+            time.sleep(delay)
+            time_left -= delay
+            slept = True
 
         if int(async_result.get('finished', 0)) != 1:
             if async_result.get('_ansible_parsed'):
@@ -81,6 +81,8 @@ class TaskQueueManager:
 
         self._callbacks_loaded = False
         self._callback_plugins = []
+        self._callback_methods = {}
+        self._callback_methods_key = None
         self._start_at_done = False
 
         # make sure any module paths (if specified) are added to the module_loader
@@ -269,7 +271,7 @@ class TaskQueueManager:
         # any hosts as failed in the iterator here which may have been marked
         # as failed in previous runs. Then we clear the internal list of failed
         # hosts so we know what failed this round.
-        for host_name in self._failed_hosts.keys():
+        for host_name in self._failed_hosts:
             host = self._inventory.get_host(host_name)
             iterator.mark_host_failed(host)
 
@@ -338,13 +340,24 @@ class TaskQueueManager:
                     defunct = True
         return defunct
 
-    def send_callback(self, method_name, *args, **kwargs):
-        for callback_plugin in [self._stdout_callback] + self._callback_plugins:
-            # a plugin that set self.disabled to True will not be called
-            # see osx_say.py example for such a plugin
-            if getattr(callback_plugin, 'disabled', False):
-                continue
+    def _get_callback_methods(self, method_name):
+        '''
+        Returns a list of (callback_plugin, methods) pairs for the given callback
+        method name. The lookups are cached until the set of loaded callback
+        plugins changes.
+        '''
+        key = (self._stdout_callback, len(self._callback_plugins))
+        if key != self._callback_methods_key:
+            self._callback_methods = {}
+            self._callback_methods_key = key
+
+        try:
+            return self._callback_methods[method_name]
+        except KeyError:
+            pass
 
+        callback_methods = []
+        for callback_plugin in [self._stdout_callback] + self._callback_plugins:
             # try to find v2 method, fallback to v1 method, ignore callback if no method found
             methods = []
             for possible in [method_name, 'v2_on_any']:
@@ -353,6 +366,17 @@ class TaskQueueManager:
                     gotit = getattr(callback_plugin, possible.replace('v2_', ''), None)
                 if gotit is not None:
                     methods.append(gotit)
+            callback_methods.append((callback_plugin, methods))
+
+        self._callback_methods[method_name] = callback_methods
+        return callback_methods
+
+    def send_callback(self, method_name, *args, **kwargs):
+        for (callback_plugin, methods) in self._get_callback_methods(method_name):
+            # a plugin that set self.disabled to True will not be called
+            # see osx_say.py example for such a plugin
+            if getattr(callback_plugin, 'disabled', False):
+                continue
 
             for method in methods:
                 try:
@@ -123,7 +123,7 @@ class InventoryManager(object):
         self._loader = loader
         self._inventory = InventoryData()
 
-        # a list of host(names) to contain current inquiries to
+        # a set of host names to contain current inquiries to
         self._restriction = None
         self._subset = None
 
@@ -309,8 +309,9 @@ class InventoryManager(object):
         except Exception:
             raise AnsibleError('invalid host list pattern: %s' % pattern_str)
 
+        match = pattern.match
         for item in items:
-            if pattern.match(getattr(item, item_attr)):
+            if match(getattr(item, item_attr)):
                 results.append(item)
         return results
 
@@ -330,8 +331,13 @@ class InventoryManager(object):
         if not ignore_limits and self._subset:
             pattern_hash += u":%s" % to_text(self._subset)
 
+        # the restriction can be very large (ie. every host in a serial batch), so
+        # rather than rendering it into the key on every call, the frozenset of
+        # names itself is made part of the key (its hash is only computed once)
         if not ignore_restrictions and self._restriction:
-            pattern_hash += u":%s" % to_text(self._restriction)
+            pattern_hash = (pattern_hash, self._restriction)
+        else:
+            pattern_hash = (pattern_hash, None)
 
         if pattern_hash not in self._hosts_patterns_cache:
 
@@ -341,7 +347,7 @@ class InventoryManager(object):
             # mainly useful for hostvars[host] access
             if not ignore_limits and self._subset:
                 # exclude hosts not in a subset, if defined
-                subset = self._evaluate_patterns(self._subset)
+                subset = set(self._evaluate_patterns(self._subset))
                 hosts = [h for h in hosts if h in subset]
 
             if not ignore_restrictions and self._restriction:
@@ -383,11 +389,14 @@ class InventoryManager(object):
             else:
                 that = self._match_one_pattern(p)
                 if p.startswith("!"):
+                    that = set(that)
                     hosts = [h for h in hosts if h not in that]
                 elif p.startswith("&"):
+                    that = set(that)
                     hosts = [h for h in hosts if h in that]
                 else:
-                    to_append = [h for h in that if h.name not in [y.name for y in hosts]]
+                    existing_hosts = set(y.name for y in hosts)
+                    to_append = [h for h in that if h.name not in existing_hosts]
                     hosts.extend(to_append)
         return hosts
 
@@ -513,10 +522,12 @@ class InventoryManager(object):
         """
 
         results = []
+        seen = set()
 
         def __append_host_to_results(host):
-            if host.name not in results:
+            if host.name not in seen:
                 if not host.implicit:
+                    seen.add(host.name)
                     results.append(host)
 
         matched = False
@@ -568,7 +579,7 @@ class InventoryManager(object):
             return
         elif not isinstance(restriction, list):
             restriction = [restriction]
-        self._restriction = [h.name for h in restriction]
+        self._restriction = frozenset(h.name for h in restriction)
 
     def subset(self, subset_pattern):
         """
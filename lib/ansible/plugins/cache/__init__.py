@@ -169,22 +169,19 @@ class BaseFileCacheModule(BaseCacheModule):
         return keys
 
     def contains(self, key):
-        cachefile = "%s/%s" % (self._cache_dir, key)
-
         if key in self._cache:
             return True
 
-        if self.has_expired(key):
-            return False
+        # a single stat answers both 'does it exist' and 'has it expired'
+        cachefile = "%s/%s" % (self._cache_dir, key)
         try:
-            os.stat(cachefile)
-            return True
+            st = os.stat(cachefile)
         except (OSError, IOError) as e:
-            if e.errno == errno.ENOENT:
-                return False
-            else:
+            if e.errno != errno.ENOENT:
                 display.warning("error in '%s' cache plugin while trying to stat %s : %s" % (self.plugin_name, cachefile, to_bytes(e)))
-                pass
+            return False
+
+        return self._timeout == 0 or time.time() - st.st_mtime <= self._timeout
 
     def delete(self, key):
         try:
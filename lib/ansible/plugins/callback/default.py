@@ -243,7 +243,7 @@ class CallbackModule(CallbackBase):
     def v2_playbook_on_stats(self, stats):
         self._display.banner("PLAY RECAP")
 
-        hosts = sorted(stats.processed.keys())
+        hosts = sorted(stats.processed)
         for h in hosts:
             t = stats.summarize(h)
 
@@ -480,7 +480,7 @@ class CallbackModule_dense(CallbackModule_default):
         sys.stdout.write(vt100.restore + vt100.reset + '\n' + vt100.save + vt100.clearline)
         sys.stdout.flush()
 
-        hosts = sorted(stats.processed.keys())
+        hosts = sorted(stats.processed)
         for h in hosts:
             t = stats.summarize(h)
             self._display.display(u"%s : %s %s %s %s" % (
@@ -145,7 +145,7 @@ class CallbackModule(CallbackBase):
         status = defaultdict(lambda: 0)
         metrics = {}
 
-        for host in stats.processed.keys():
+        for host in stats.processed:
             sum = stats.summarize(host)
             status["applied"] = sum['changed']
             status["failed"] = sum['failures'] + sum['unreachable']
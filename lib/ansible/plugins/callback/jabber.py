@@ -78,7 +78,7 @@ class CallbackModule(CallbackBase):
 
     def playbook_on_stats(self, stats):
         name = self.play
-        hosts = sorted(stats.processed.keys())
+        hosts = sorted(stats.processed)
         failures = False
         unreachable = False
         for h in hosts:
@@ -100,7 +100,7 @@ class CallbackModule(CallbackBase):
 
     def v2_playbook_on_stats(self, stats):
         summarize_stat = {}
-        for host in stats.processed.keys():
+        for host in stats.processed:
             summarize_stat[host] = stats.summarize(host)
 
         if self.errors == 0:
@@ -214,7 +214,7 @@ class CallbackModule(CallbackBase):
         self.printed_last_task = False
         self._print_task('STATS')
 
-        hosts = sorted(stats.processed.keys())
+        hosts = sorted(stats.processed)
         for host in hosts:
             s = stats.summarize(host)
 
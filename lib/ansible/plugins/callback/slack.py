@@ -184,7 +184,7 @@ class CallbackModule(CallbackBase):
     def v2_playbook_on_stats(self, stats):
         """Display info about playbook statistics"""
 
-        hosts = sorted(stats.processed.keys())
+        hosts = sorted(stats.processed)
 
         t = prettytable.PrettyTable(['Host', 'Ok', 'Changed', 'Unreachable',
                                      'Failures'])
@@ -206,6 +206,10 @@ class Connection(ConnectionBase):
         self.control_path = C.ANSIBLE_SSH_CONTROL_PATH
         self.control_path_dir = C.ANSIBLE_SSH_CONTROL_PATH_DIR
 
+        # set once the ControlPath directory has been created and checked,
+        # so every ssh/scp/sftp command run over this connection reuses it
+        self._control_path_dir_ready = False
+
     # The connection is created by running ssh/scp/sftp from the exec_command,
     # put_file, and fetch_file methods, so we don't need to do any connection
     # management here.
@@ -400,9 +404,11 @@ class Connection(ConnectionBase):
                 b_cpdir = to_bytes(cpdir, errors='surrogate_or_strict')
 
                 # The directory must exist and be writable.
-                makedirs_safe(b_cpdir, 0o700)
-                if not os.access(b_cpdir, os.W_OK):
-                    raise AnsibleError("Cannot write to ControlPath %s" % to_native(cpdir))
+                if not self._control_path_dir_ready:
+                    makedirs_safe(b_cpdir, 0o700)
+                    if not os.access(b_cpdir, os.W_OK):
+                        raise AnsibleError("Cannot write to ControlPath %s" % to_native(cpdir))
+                    self._control_path_dir_ready = True
 
                 if not self.control_path:
                     self.control_path = self._create_control_path(
@@ -124,6 +124,18 @@ class StrategyBase:
         # outstanding tasks still in queue
         self._blocked_hosts = dict()
 
+        # cache of the remaining/failed hosts for the play, which is only
+        # rebuilt when the failed or unreachable hosts change or inventory
+        # is modified, rather than on every call for every host and task
+        self._hosts_cache = None
+        self._hosts_cache_key = None
+
+        # indexes of the play's handlers by templated name and by uuid, used
+        # when processing notifications instead of scanning all handlers
+        self._handler_name_index = dict()
+        self._handler_uuid_index = dict()
+        self._handler_index_size = None
+
         self._results = deque()
         self._results_lock = threading.Condition(threading.Lock())
 
@@ -132,6 +144,12 @@ class StrategyBase:
         self._results_thread.daemon = True
         self._results_thread.start()
 
+        # create a dummy object with plugin loaders set as an easier
+        # way to share them with the forked processes. The loaders are
+        # module-level singletons, so a single object can be reused for
+        # every task/host fanned out by this strategy
+        self._shared_loader_obj = SharedPluginLoaderObj()
+
     def cleanup(self):
         self._final_q.put(_sentinel)
         self._results_thread.join()
@@ -146,7 +164,7 @@ class StrategyBase:
         # save the failed/unreachable hosts, as the run_handlers()
         # method will clear that information during its execution
         failed_hosts = iterator.get_failed_hosts()
-        unreachable_hosts = self._tqm._unreachable_hosts.keys()
+        unreachable_hosts = set(self._tqm._unreachable_hosts)
 
         display.debug("running handlers")
         handler_result = self.run_handlers(iterator, play_context)
@@ -158,7 +176,7 @@ class StrategyBase:
         # now update with the hosts (if any) that failed or were
         # unreachable during the handler execution phase
         failed_hosts = set(failed_hosts).union(iterator.get_failed_hosts())
-        unreachable_hosts = set(unreachable_hosts).union(self._tqm._unreachable_hosts.keys())
+        unreachable_hosts.update(self._tqm._unreachable_hosts)
 
         # return the appropriate code, depending on the status hosts after the run
         if not isinstance(result, bool) and result != self._tqm.RUN_OK:
@@ -170,20 +188,42 @@ class StrategyBase:
         else:
             return self._tqm.RUN_OK
 
+    def _get_cached_hosts(self, play):
+        '''
+        Returns the remaining and failed hosts (and their names) for the play,
+        reusing the previous result as long as the failed/unreachable hosts are
+        unchanged.
+        '''
+
+        failed = self._tqm._failed_hosts
+        unreachable = self._tqm._unreachable_hosts
+        key = (id(play), id(failed), len(failed), id(unreachable), len(unreachable))
+        if self._hosts_cache is None or self._hosts_cache_key != key:
+            hosts = self._inventory.get_hosts(play.hosts)
+            remaining = [host for host in hosts if host.name not in failed and host.name not in unreachable]
+            failed_hosts = [host for host in hosts if host.name in failed]
+            self._hosts_cache = (remaining, failed_hosts, [h.name for h in remaining], [h.name for h in failed_hosts])
+            self._hosts_cache_key = key
+        return self._hosts_cache
+
+    def _clear_hosts_cache(self):
+        self._hosts_cache = None
+        self._hosts_cache_key = None
+
     def get_hosts_remaining(self, play):
-        return [host for host in self._inventory.get_hosts(play.hosts)
-                if host.name not in self._tqm._failed_hosts and host.name not in self._tqm._unreachable_hosts]
+        return self._get_cached_hosts(play)[0][:]
 
     def get_failed_hosts(self, play):
-        return [host for host in self._inventory.get_hosts(play.hosts) if host.name in self._tqm._failed_hosts]
+        return self._get_cached_hosts(play)[1][:]
 
     def add_tqm_variables(self, vars, play):
         '''
         Base class method to add extra variables/information to the list of task
         vars sent through the executor engine regarding the task queue manager state.
         '''
-        vars['ansible_current_hosts'] = [h.name for h in self.get_hosts_remaining(play)]
-        vars['ansible_failed_hosts'] = [h.name for h in self.get_failed_hosts(play)]
+        (_, _, remaining_names, failed_names) = self._get_cached_hosts(play)
+        vars['ansible_current_hosts'] = remaining_names[:]
+        vars['ansible_failed_hosts'] = failed_names[:]
 
     def _queue_task(self, host, task, task_vars, play_context):
         ''' handles queueing the task up to be sent to a worker '''
@@ -207,17 +247,13 @@ class StrategyBase:
 
         # and then queue the new task
         try:
-
-            # create a dummy object with plugin loaders set as an easier
-            # way to share them with the forked processes
-            shared_loader_obj = SharedPluginLoaderObj()
-
             queued = False
             starting_worker = self._cur_worker
             while True:
                 (worker_prc, rslt_q) = self._workers[self._cur_worker]
                 if worker_prc is None or not worker_prc.is_alive():
-                    worker_prc = WorkerProcess(self._final_q, task_vars, host, task, play_context, self._loader, self._variable_manager, shared_loader_obj)
+                    worker_prc = WorkerProcess(self._final_q, task_vars, host, task, play_context, self._loader, self._variable_manager,
+                                               self._shared_loader_obj)
                     self._workers[self._cur_worker][0] = worker_prc
                     worker_prc.start()
                     display.debug("worker is %d (out of %d available)" % (self._cur_worker + 1, len(self._workers)))
@@ -271,38 +307,46 @@ class StrategyBase:
             else:
                 return self._inventory.get_host(host_name)
 
-        def search_handler_blocks_by_name(handler_name, handler_blocks):
+        def index_handler_blocks(handler_blocks):
+            # Handler names are templated without any host, so they only need to be
+            # templated once per play rather than for every notification. Both the
+            # name and uuid indexes keep the first handler matching a given key,
+            # and they are rebuilt if handler blocks are added (ie. by includes)
+            name_index = dict()
+            uuid_index = dict()
             for handler_block in handler_blocks:
                 for handler_task in handler_block.block:
+                    uuid_index.setdefault(handler_task._uuid, handler_task)
                     if handler_task.name:
                         handler_vars = self._variable_manager.get_vars(play=iterator._play, task=handler_task)
                         templar = Templar(loader=self._loader, variables=handler_vars)
-                        try:
-                            # first we check with the full result of get_name(), which may
-                            # include the role name (if the handler is from a role). If that
-                            # is not found, we resort to the simple name field, which doesn't
-                            # have anything extra added to it.
-                            target_handler_name = templar.template(handler_task.name)
-                            if target_handler_name == handler_name:
-                                return handler_task
-                            else:
-                                target_handler_name = templar.template(handler_task.get_name())
-                                if target_handler_name == handler_name:
-                                    return handler_task
-                        except (UndefinedError, AnsibleUndefinedVariable):
-                            # We skip this handler due to the fact that it may be using
-                            # a variable in the name that was conditionally included via
-                            # set_fact or some other method, and we don't want to error
-                            # out unnecessarily
-                            continue
-            return None
+                        # we index both the simple name field, which doesn't have anything
+                        # extra added to it, and the full result of get_name(), which may
+                        # include the role name (if the handler is from a role).
+                        for handler_name in (handler_task.name, handler_task.get_name()):
+                            try:
+                                target_handler_name = templar.template(handler_name)
+                            except (UndefinedError, AnsibleUndefinedVariable):
+                                # We skip this handler due to the fact that it may be using
+                                # a variable in the name that was conditionally included via
+                                # set_fact or some other method, and we don't want to error
+                                # out unnecessarily
+                                break
+                            if isinstance(target_handler_name, string_types):
+                                name_index.setdefault(target_handler_name, handler_task)
+            self._handler_name_index = name_index
+            self._handler_uuid_index = uuid_index
+            self._handler_index_size = len(handler_blocks)
+
+        def search_handler_blocks_by_name(handler_name, handler_blocks):
+            if self._handler_index_size != len(handler_blocks):
+                index_handler_blocks(handler_blocks)
+            return self._handler_name_index.get(handler_name)
 
         def search_handler_blocks_by_uuid(handler_uuid, handler_blocks):
-            for handler_block in handler_blocks:
-                for handler_task in handler_block.block:
-                    if handler_uuid == handler_task._uuid:
-                        return handler_task
-            return None
+            if self._handler_index_size != len(handler_blocks):
+                index_handler_blocks(handler_blocks)
+            return self._handler_uuid_index.get(handler_uuid)
 
         def parent_handler_match(target_handler, handler_name):
             if target_handler:
@@ -434,57 +478,63 @@ class StrategyBase:
                 else:
                     result_items = [task_result._result]
 
-                for result_item in result_items:
-                    if '_ansible_notify' in result_item:
-                        if task_result.is_changed():
-                            # The shared dictionary for notified handlers is a proxy, which
-                            # does not detect when sub-objects within the proxy are modified.
-                            # So, per the docs, we reassign the list so the proxy picks up and
-                            # notifies all other threads
-                            for handler_name in result_item['_ansible_notify']:
-                                found = False
-                                # Find the handler using the above helper.  First we look up the
-                                # dependency chain of the current task (if it's from a role), otherwise
-                                # we just look through the list of handlers in the current play/all
-                                # roles and use the first one that matches the notify name
-                                target_handler = search_handler_blocks_by_name(handler_name, iterator._play.handlers)
-                                if target_handler is not None:
+                if task_result.is_changed():
+                    # every item of a looped task carries the same notify list, so
+                    # collect the handler names first and resolve each one only once
+                    notified_names = []
+                    for result_item in result_items:
+                        for handler_name in result_item.get('_ansible_notify', []):
+                            if handler_name not in notified_names:
+                                notified_names.append(handler_name)
+                    # The shared dictionary for notified handlers is a proxy, which
+                    # does not detect when sub-objects within the proxy are modified.
+                    # So, per the docs, we reassign the list so the proxy picks up and
+                    # notifies all other threads
+                    for handler_name in notified_names:
+                        found = False
+                        # Find the handler using the above helper.  First we look up the
+                        # dependency chain of the current task (if it's from a role), otherwise
+                        # we just look through the list of handlers in the current play/all
+                        # roles and use the first one that matches the notify name
+                        target_handler = search_handler_blocks_by_name(handler_name, iterator._play.handlers)
+                        if target_handler is not None:
+                            found = True
+                            if original_host not in self._notified_handlers[target_handler._uuid]:
+                                self._notified_handlers[target_handler._uuid].append(original_host)
+                                # FIXME: should this be a callback?
+                                display.vv("NOTIFIED HANDLER %s" % (handler_name,))
+                        else:
+                            # As there may be more than one handler with the notified name as the
+                            # parent, so we just keep track of whether or not we found one at all
+                            for target_handler_uuid in self._notified_handlers:
+                                target_handler = search_handler_blocks_by_uuid(target_handler_uuid, iterator._play.handlers)
+                                if target_handler and parent_handler_match(target_handler, handler_name):
                                     found = True
                                     if original_host not in self._notified_handlers[target_handler._uuid]:
                                         self._notified_handlers[target_handler._uuid].append(original_host)
-                                        # FIXME: should this be a callback?
-                                        display.vv("NOTIFIED HANDLER %s" % (handler_name,))
+                                        display.vv("NOTIFIED HANDLER %s" % (target_handler.get_name(),))
+
+                        if handler_name in self._listening_handlers:
+                            for listening_handler_uuid in self._listening_handlers[handler_name]:
+                                listening_handler = search_handler_blocks_by_uuid(listening_handler_uuid, iterator._play.handlers)
+                                if listening_handler is not None:
+                                    found = True
                                 else:
-                                    # As there may be more than one handler with the notified name as the
-                                    # parent, so we just keep track of whether or not we found one at all
-                                    for target_handler_uuid in self._notified_handlers:
-                                        target_handler = search_handler_blocks_by_uuid(target_handler_uuid, iterator._play.handlers)
-                                        if target_handler and parent_handler_match(target_handler, handler_name):
-                                            found = True
-                                            if original_host not in self._notified_handlers[target_handler._uuid]:
-                                                self._notified_handlers[target_handler._uuid].append(original_host)
-                                                display.vv("NOTIFIED HANDLER %s" % (target_handler.get_name(),))
-
-                                if handler_name in self._listening_handlers:
-                                    for listening_handler_uuid in self._listening_handlers[handler_name]:
-                                        listening_handler = search_handler_blocks_by_uuid(listening_handler_uuid, iterator._play.handlers)
-                                        if listening_handler is not None:
-                                            found = True
-                                        else:
-                                            continue
-                                        if original_host not in self._notified_handlers[listening_handler._uuid]:
-                                            self._notified_handlers[listening_handler._uuid].append(original_host)
-                                            display.vv("NOTIFIED HANDLER %s" % (listening_handler.get_name(),))
-
-                                # and if none were found, then we raise an error
-                                if not found:
-                                    msg = ("The requested handler '%s' was not found in either the main handlers list nor in the listening "
-                                           "handlers list" % handler_name)
-                                    if C.ERROR_ON_MISSING_HANDLER:
-                                        raise AnsibleError(msg)
-                                    else:
-                                        display.warning(msg)
+                                    continue
+                                if original_host not in self._notified_handlers[listening_handler._uuid]:
+                                    self._notified_handlers[listening_handler._uuid].append(original_host)
+                                    display.vv("NOTIFIED HANDLER %s" % (listening_handler.get_name(),))
+
+                        # and if none were found, then we raise an error
+                        if not found:
+                            msg = ("The requested handler '%s' was not found in either the main handlers list nor in the listening "
+                                   "handlers list" % handler_name)
+                            if C.ERROR_ON_MISSING_HANDLER:
+                                raise AnsibleError(msg)
+                            else:
+                                display.warning(msg)
 
+                for result_item in result_items:
                     if 'add_host' in result_item:
                         # this task added a new host (add_host module)
                         new_host_info = result_item.get('add_host', dict())
@@ -613,6 +663,7 @@ class StrategyBase:
 
             # clear pattern caching completely since it's unpredictable what patterns may have referenced the group
             self._inventory.clear_pattern_cache()
+            self._clear_hosts_cache()
 
             # reconcile inventory, ensures inventory rules are followed
             self._inventory.reconcile_inventory()
@@ -648,6 +699,7 @@ class StrategyBase:
         if changed:
             self._inventory.clear_pattern_cache()
             self._inventory.reconcile_inventory()
+            self._clear_hosts_cache()
 
         return changed
 
@@ -862,6 +914,7 @@ class StrategyBase:
             msg = "ran handlers"
         elif meta_action == 'refresh_inventory':
             self._inventory.refresh_inventory()
+            self._clear_hosts_cache()
             msg = "inventory successfully refreshed"
         elif meta_action == 'clear_facts':
             if _evaluate_conditional(target_host):
@@ -876,6 +929,7 @@ class StrategyBase:
                     self._tqm._failed_hosts.pop(host.name, False)
                     self._tqm._unreachable_hosts.pop(host.name, False)
                     iterator._host_states[host.name].fail_state = iterator.FAILED_NONE
+                self._clear_hosts_cache()
                 msg = "cleared host errors"
             else:
                 skipped = True
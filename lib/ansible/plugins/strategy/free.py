@@ -200,8 +200,8 @@ class StrategyModule(StrategyBase):
                         display.warning(str(e))
                         continue
 
+                    task_vars = self._variable_manager.get_vars(play=iterator._play, task=included_file._task)
                     for new_block in new_blocks:
-                        task_vars = self._variable_manager.get_vars(play=iterator._play, task=included_file._task)
                         final_block = new_block.filter_tagged_tasks(play_context, task_vars)
                         for host in hosts_left:
                             if host in included_file._hosts:
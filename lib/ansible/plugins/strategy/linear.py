@@ -198,6 +198,10 @@ class StrategyModule(StrategyBase):
                 # flag set if task is set to any_errors_fatal
                 any_errors_fatal = False
 
+                # action plugin classes looked up so far, as hosts in lockstep almost
+                # always share the same task there's no need to resolve it per host
+                action_classes = {}
+
                 results = []
                 for (host, task) in host_tasks:
                     if not task:
@@ -213,12 +217,14 @@ class StrategyModule(StrategyBase):
                     # sets BYPASS_HOST_LOOP to true, or if it has run_once enabled. If so, we
                     # will only send this task to the first host in the list.
 
-                    try:
-                        action = action_loader.get(task.action, class_only=True)
-                    except KeyError:
-                        # we don't care here, because the action may simply not have a
-                        # corresponding action plugin
-                        action = None
+                    if task.action not in action_classes:
+                        try:
+                            action_classes[task.action] = action_loader.get(task.action, class_only=True)
+                        except KeyError:
+                            # we don't care here, because the action may simply not have a
+                            # corresponding action plugin
+                            action_classes[task.action] = None
+                    action = action_classes[task.action]
 
                     # check to see if this task should be skipped, due to it being a member of a
                     # role which has already run (and whether that role allows duplicate execution)
@@ -352,17 +358,20 @@ class StrategyModule(StrategyBase):
                         try:
                             new_blocks = self._load_included_file(included_file, iterator=iterator)
 
+                            # the vars used for tag filtering only depend on the include
+                            # task, so they are the same for every block it brought in
+                            task_vars = self._variable_manager.get_vars(
+                                play=iterator._play,
+                                task=included_file._task,
+                            )
+
                             display.debug("iterating over new_blocks loaded from include file")
                             for new_block in new_blocks:
-                                task_vars = self._variable_manager.get_vars(
-                                    play=iterator._play,
-                                    task=included_file._task,
-                                )
                                 display.debug("filtering new block on tags")
                                 final_block = new_block.filter_tagged_tasks(play_context, task_vars)
                                 display.debug("done filtering new block on tags")
 
-                                noop_block = Block(parent_block=task._parent)
+                                noop_block = Block(parent_block=included_file._task._parent)
                                 noop_block.block = [noop_task for t in new_block.block]
                                 noop_block.always = [noop_task for t in new_block.always]
                                 noop_block.rescue = [noop_task for t in new_block.rescue]
@@ -78,7 +78,7 @@ def strip_internal_keys(dirty):
     and remove them from the clean one before returning it
     '''
     clean = dirty.copy()
-    for k in dirty.keys():
+    for k in dirty:
         if isinstance(k, string_types) and k.startswith('_ansible_'):
             del clean[k]
         elif isinstance(dirty[k], dict):
@@ -328,13 +328,11 @@ class VariableManager:
         if play:
             all_vars = combine_vars(all_vars, play.get_vars())
 
-            for vars_file_item in play.get_vars_files():
-                # create a set of temporary vars here, which incorporate the extra
-                # and magic vars so we can properly template the vars_files entries
-                temp_vars = combine_vars(all_vars, self._extra_vars)
-                temp_vars = combine_vars(temp_vars, magic_variables)
-                templar = Templar(loader=self._loader, variables=temp_vars)
+            vars_files = play.get_vars_files()
+            if vars_files:
+                templar = Templar(loader=self._loader)
 
+            for vars_file_item in vars_files:
                 # we assume each item in the list is itself a list, as we
                 # support "conditional includes" for vars_files, which mimics
                 # the with_first_found mechanism.
@@ -342,6 +340,15 @@ class VariableManager:
                 if not isinstance(vars_file_list, list):
                     vars_file_list = [vars_file_list]
 
+                # create a set of temporary vars here, which incorporate the extra
+                # and magic vars so we can properly template the vars_files entries.
+                # Merging these is expensive and this runs for every host and task,
+                # so it is skipped for the common case of plain file names.
+                if any(templar._contains_vars(vars_file) for vars_file in vars_file_list):
+                    temp_vars = combine_vars(all_vars, self._extra_vars)
+                    temp_vars = combine_vars(temp_vars, magic_variables)
+                    templar.set_available_variables(temp_vars)
+
                 # now we iterate through the (potential) files, and break out
                 # as soon as we read one from the list. If none are found, we
                 # raise an error, which is silently ignored at this point.
@@ -582,13 +589,17 @@ class VariableManager:
 
         assert isinstance(facts, dict), "the type of 'facts' to set for host_facts should be a dict but is a %s" % type(facts)
 
-        if host.name not in self._fact_cache:
-            self._fact_cache[host.name] = facts
+        # fetch the existing facts once and merge into them, rather than
+        # checking for the host first and looking it up again to update it
+        # (which also did not work with the plain dict fallback cache)
+        try:
+            host_cache = self._fact_cache[host.name]
+        except KeyError:
+            host_cache = facts
         else:
-            try:
-                self._fact_cache.update(host.name, facts)
-            except KeyError:
-                self._fact_cache[host.name] = facts
+            host_cache.update(facts)
+
+        self._fact_cache[host.name] = host_cache
 
     def set_nonpersistent_facts(self, host, facts):
         '''
@@ -597,13 +608,7 @@ class VariableManager:
 
         assert isinstance(facts, dict), "the type of 'facts' to set for nonpersistent_facts should be a dict but is a %s" % type(facts)
 
-        if host.name not in self._nonpersistent_fact_cache:
-            self._nonpersistent_fact_cache[host.name] = facts
-        else:
-            try:
-                self._nonpersistent_fact_cache[host.name].update(facts)
-            except KeyError:
-                self._nonpersistent_fact_cache[host.name] = facts
+        self._nonpersistent_fact_cache.setdefault(host.name, dict()).update(facts)
 
     def set_host_variable(self, host, varname, value):
         '''
@@ -19,6 +19,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import os
+
 from ansible.compat.tests import unittest
 
 from ansible.release import __version__
@@ -39,3 +41,18 @@ class TestCliVersion(unittest.TestCase):
     def test_version_info_gitinfo(self):
         version_info = cli.CLI.version_info(gitinfo=True)
         self.assertIn('python version', version_info['string'])
+
+
+class TestCliModulePath(unittest.TestCase):
+
+    def test_module_path_split(self):
+        parser = cli.CLI.base_parser(module_opts=True)
+        value = os.pathsep.join(['/path/to/modules', '/other/modules'])
+        (options, args) = parser.parse_args(['-M', value])
+        self.assertEqual(options.module_path, ['/path/to/modules', '/other/modules'])
+
+    def test_module_path_skips_empty_entries(self):
+        parser = cli.CLI.base_parser(module_opts=True)
+        value = os.pathsep.join(['/path/to/modules', '', '/other/modules', ''])
+        (options, args) = parser.parse_args(['-M', value])
+        self.assertEqual(options.module_path, ['/path/to/modules', '/other/modules'])
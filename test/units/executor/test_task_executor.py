@@ -95,6 +95,13 @@ class TestTaskExecutor(unittest.TestCase):
         te._get_loop_items = MagicMock(return_value=['a', 'b', 'c'])
         te._run_loop = MagicMock(return_value=[dict(item='a', changed=True), dict(item='b', failed=True), dict(item='c')])
         res = te.run()
+        self.assertTrue(res['failed'])
+        self.assertEqual(res['msg'], 'One or more items failed')
+
+        te._run_loop = MagicMock(return_value=[dict(item='a', changed=True), dict(item='b'), dict(item='c')])
+        res = te.run()
+        self.assertNotIn('failed', res)
+        self.assertEqual(res['msg'], 'All items completed')
 
         te._get_loop_items = MagicMock(side_effect=AnsibleError(""))
         res = te.run()
@@ -329,6 +336,15 @@ class TestTaskExecutor(unittest.TestCase):
         self.assertEqual(new_items, items)
         self.assertEqual(mock_task.args, {'name': '{{ item["package"] }}'})
 
+        # Actions which can never be squashed don't need a templar at all
+        mock_task.action = 'foo'
+        mock_task.args = {'name': '{{ item }}'}
+        with patch('ansible.executor.task_executor.Templar') as mock_templar:
+            new_items = te._squash_items(items=items, loop_var='item', variables=job_vars)
+        self.assertFalse(mock_templar.called)
+        self.assertEqual(new_items, items)
+        self.assertEqual(mock_task.args, {'name': '{{ item }}'})
+
         items = [
             dict(name='a', state='present'),
             dict(name='b', state='present'),
@@ -484,3 +500,38 @@ class TestTaskExecutor(unittest.TestCase):
             mock_templar = MagicMock()
             res = te._poll_async_result(result=dict(ansible_job_id=1), templar=mock_templar)
             self.assertEqual(res, dict(finished=1))
+
+        # a job which has already finished should not wait on the poll interval
+        with patch.object(action_loader, 'get', _get):
+            with patch('ansible.executor.task_executor.time.sleep') as mock_sleep:
+                mock_templar = MagicMock()
+                res = te._poll_async_result(result=dict(ansible_job_id=1), templar=mock_templar)
+                self.assertEqual(res, dict(finished=1))
+                self.assertFalse(mock_sleep.called)
+
+        # the job status file may not have been written yet when the first
+        # check runs, so a missing job is retried after one poll interval
+        mock_action = MagicMock()
+        mock_action.run.side_effect = [
+            dict(failed=True, msg='could not find job', started=1, finished=1, _ansible_parsed=True),
+            dict(finished=1),
+        ]
+        with patch.object(action_loader, 'get', return_value=mock_action):
+            with patch('ansible.executor.task_executor.time.sleep') as mock_sleep:
+                mock_templar = MagicMock()
+                res = te._poll_async_result(result=dict(ansible_job_id=1), templar=mock_templar)
+                self.assertEqual(res, dict(finished=1))
+                self.assertEqual(mock_action.run.call_count, 2)
+                mock_sleep.assert_called_once_with(0.05)
+
+        # but a job which is still missing after that is reported as is
+        missing = dict(failed=True, msg='could not find job', started=1, finished=1, _ansible_parsed=True)
+        mock_action = MagicMock()
+        mock_action.run.return_value = missing
+        with patch.object(action_loader, 'get', return_value=mock_action):
+            with patch('ansible.executor.task_executor.time.sleep') as mock_sleep:
+                mock_templar = MagicMock()
+                res = te._poll_async_result(result=dict(ansible_job_id=1), templar=mock_templar)
+                self.assertEqual(res, missing)
+                self.assertEqual(mock_action.run.call_count, 2)
+                self.assertEqual(mock_sleep.call_count, 1)
@@ -115,3 +115,30 @@ class TestTaskQueueManagerCallbacks(unittest.TestCase):
         self._tqm._callback_plugins.append(callback_module)
         self._tqm.send_callback('v2_playbook_on_start', self._playbook)
         register.assert_called_once_with(callback_module, self._playbook)
+
+    def test_task_queue_manager_callbacks_added_after_first_send(self):
+        """
+        Assert that a callback plugin added after a callback has
+        already been sent still receives later callbacks.
+        """
+        register = self._register
+
+        class CallbackModule(CallbackBase):
+            CALLBACK_VERSION = 2.0
+            CALLBACK_TYPE = 'notification'
+            CALLBACK_NAME = 'current_module'
+
+            def v2_playbook_on_start(self, playbook):
+                register(self, playbook)
+
+        first_module = CallbackModule()
+        self._tqm._callback_plugins.append(first_module)
+        self._tqm.send_callback('v2_playbook_on_start', self._playbook)
+        register.assert_called_once_with(first_module, self._playbook)
+
+        register.reset_mock()
+        second_module = CallbackModule()
+        self._tqm._callback_plugins.append(second_module)
+        self._tqm.send_callback('v2_playbook_on_start', self._playbook)
+        self.assertEqual(register.call_count, 2)
+        register.assert_called_with(second_module, self._playbook)
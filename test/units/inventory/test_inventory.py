@@ -159,3 +159,23 @@ class InventoryDefaultGroup(unittest.TestCase):
         self.assertEqual(set(['host1', 'host2', 'host3']), ungrouped_hosts)
         servers_hosts = set(host.name for host in inventory.groups['servers'].get_hosts())
         self.assertEqual(set(['host3', 'host4', 'host5']), servers_hosts)
+
+    def test_restrict_to_hosts(self):
+        inventory = self._get_inventory("""
+            host1
+            host2
+            [servers]
+            host3
+            host4
+            """)
+
+        all_names = set(['host1', 'host2', 'host3', 'host4'])
+        self.assertEqual(set(h.name for h in inventory.get_hosts('all')), all_names)
+
+        inventory.restrict_to_hosts([inventory.get_host('host2'), inventory.get_host('host3')])
+        self.assertEqual(set(h.name for h in inventory.get_hosts('all')), set(['host2', 'host3']))
+        self.assertEqual(set(h.name for h in inventory.get_hosts('servers')), set(['host3']))
+        self.assertEqual(set(h.name for h in inventory.get_hosts('all', ignore_restrictions=True)), all_names)
+
+        inventory.remove_restriction()
+        self.assertEqual(set(h.name for h in inventory.get_hosts('all')), all_names)
@@ -19,10 +19,15 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import os
+import shutil
+import tempfile
+
 from ansible.compat.tests import unittest, mock
 from ansible.errors import AnsibleError
 from ansible.plugins.cache import FactCache
 from ansible.plugins.cache.base import BaseCacheModule
+from ansible.plugins.cache.jsonfile import CacheModule as JsonfileCache
 from ansible.plugins.cache.memory import CacheModule as MemoryCache
 
 HAVE_MEMCACHED = True
@@ -122,3 +127,34 @@ class TestAbstractClass(unittest.TestCase):
     @unittest.skipUnless(HAVE_REDIS, 'Redis python module not installed')
     def test_redis_cachemodule(self):
         self.assertIsInstance(RedisCache(), RedisCache)
+
+
+class TestJsonfileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        with mock.patch('ansible.constants.CACHE_PLUGIN_CONNECTION', self.cache_dir):
+            with mock.patch('ansible.constants.CACHE_PLUGIN_TIMEOUT', 60):
+                self.cache = JsonfileCache()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_contains(self):
+        self.assertFalse(self.cache.contains('host1'))
+
+        self.cache.set('host1', dict(a=1))
+        self.assertTrue(self.cache.contains('host1'))
+
+        # entries written by another run are found on disk
+        self.cache._cache = {}
+        self.assertTrue(self.cache.contains('host1'))
+        self.assertEqual(self.cache.get('host1'), dict(a=1))
+
+    def test_contains_expired(self):
+        self.cache.set('host1', dict(a=1))
+        self.cache._cache = {}
+
+        cachefile = os.path.join(self.cache_dir, 'host1')
+        os.utime(cachefile, (0, 0))
+        self.assertFalse(self.cache.contains('host1'))
@@ -178,6 +178,12 @@ class TestStrategyBase(unittest.TestCase):
 
         mock_tqm._unreachable_hosts = ["host02"]
         self.assertEqual(strategy_base.get_hosts_remaining(play=mock_play), mock_hosts[2:])
+
+        # repeated lookups with no new failures are served from the cache
+        mock_inventory.get_hosts.reset_mock()
+        self.assertEqual(strategy_base.get_hosts_remaining(play=mock_play), mock_hosts[2:])
+        self.assertEqual(strategy_base.get_failed_hosts(play=mock_play), [mock_hosts[0]])
+        self.assertEqual(mock_inventory.get_hosts.call_count, 0)
         strategy_base.cleanup()
 
     @patch.object(WorkerProcess, 'run')
@@ -418,6 +424,94 @@ class TestStrategyBase(unittest.TestCase):
         # self.assertRaises(AnsibleError, strategy_base._process_pending_results, iterator=mock_iterator)
         strategy_base.cleanup()
 
+    def test_strategy_base_process_pending_results_handler_lookup(self):
+        mock_tqm = MagicMock()
+        mock_tqm._terminated = False
+        mock_tqm._failed_hosts = dict()
+        mock_tqm._unreachable_hosts = dict()
+        mock_tqm._final_q = Queue.Queue()
+        mock_tqm._options = MagicMock(step=False, diff=False)
+
+        mock_host = MagicMock()
+        mock_host.name = 'test01'
+
+        mock_task = MagicMock()
+        mock_task._role = None
+        mock_task._parent = None
+        mock_task.ignore_errors = False
+        mock_task._uuid = uuid.uuid4()
+        mock_task.loop = None
+        mock_task.copy.return_value = mock_task
+
+        def _make_handler(name, full_name):
+            handler = MagicMock(Handler)
+            handler.name = name
+            handler.get_name.return_value = full_name
+            handler._uuid = uuid.uuid4()
+            handler._parent = None
+            return handler
+
+        def _make_handler_block(*handlers):
+            handler_block = MagicMock()
+            handler_block.block = list(handlers)
+            handler_block.rescue = []
+            handler_block.always = []
+            return handler_block
+
+        role_handler = _make_handler('restart', 'myrole : restart')
+        # the role-prefixed name of this handler is the plain name of the next
+        # one, and as the earlier handler it should be the one notified
+        first_handler = _make_handler('reload', 'myrole : reload')
+        second_handler = _make_handler('myrole : reload', 'myrole : reload')
+
+        mock_play = MagicMock()
+        mock_play.handlers = [_make_handler_block(role_handler, first_handler, second_handler)]
+
+        mock_iterator = MagicMock()
+        mock_iterator._play = mock_play
+        mock_iterator.get_original_task.return_value = mock_task
+
+        mock_inventory = MagicMock()
+        mock_inventory.get_host.return_value = mock_host
+
+        mock_var_mgr = MagicMock()
+        mock_var_mgr.get_vars.return_value = dict()
+
+        mock_tqm._notified_handlers = dict((h._uuid, []) for h in mock_play.handlers[0].block)
+        mock_tqm._listening_handlers = {}
+
+        strategy_base = StrategyBase(tqm=mock_tqm)
+        strategy_base._inventory = mock_inventory
+        strategy_base._variable_manager = mock_var_mgr
+        strategy_base._loader = DictDataLoader({})
+
+        def _notify(*handler_names):
+            strategy_base._results.append(TaskResult(host=mock_host.name, task=mock_task._uuid,
+                                                     return_data=dict(changed=True, _ansible_notify=list(handler_names))))
+            strategy_base._blocked_hosts['test01'] = True
+            strategy_base._pending_results = 1
+            return strategy_base._process_pending_results(iterator=mock_iterator)
+
+        try:
+            # handlers can be notified by their role-prefixed name
+            self.assertEqual(len(_notify('myrole : restart')), 1)
+            self.assertEqual(mock_tqm._notified_handlers[role_handler._uuid], [mock_host])
+
+            # the first handler matching by either name wins
+            _notify('myrole : reload')
+            self.assertEqual(mock_tqm._notified_handlers[first_handler._uuid], [mock_host])
+            self.assertEqual(mock_tqm._notified_handlers[second_handler._uuid], [])
+
+            # handler blocks added after the first lookup (ie. from an include
+            # in the handlers) are picked up as well
+            included_handler = _make_handler('included handler', 'included handler')
+            mock_play.handlers.append(_make_handler_block(included_handler))
+            mock_tqm._notified_handlers[included_handler._uuid] = []
+            _notify('included handler')
+            self.assertEqual(mock_tqm._notified_handlers[included_handler._uuid], [mock_host])
+        finally:
+            strategy_base.cleanup()
+
     def test_strategy_base_load_included_file(self):
         fake_loader = DictDataLoader({
             "test.yml": """
@@ -0,0 +1,116 @@
+# (c) 2017 Ansible Project
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from units.mock.loader import DictDataLoader
+
+from ansible.compat.tests import unittest
+from ansible.compat.tests.mock import patch, MagicMock
+from ansible.executor.task_queue_manager import TaskQueueManager
+from ansible.inventory.host import Host
+from ansible.module_utils.six.moves import queue as Queue
+from ansible.playbook.block import Block
+from ansible.playbook.included_file import IncludedFile
+from ansible.plugins.strategy import StrategyBase
+from ansible.plugins.strategy.linear import StrategyModule
+
+
+class TestStrategyLinear(unittest.TestCase):
+
+    @patch.object(StrategyBase, 'run', return_value=0)
+    @patch.object(IncludedFile, 'process_include_results')
+    def test_noop_block_parent_for_excluded_hosts(self, mock_process_include_results, mock_base_run):
+        fake_loader = DictDataLoader({})
+
+        host1 = Host('host1')
+        host2 = Host('host2')
+
+        mock_var_manager = MagicMock()
+        mock_var_manager.get_vars.return_value = dict()
+
+        mock_tqm = MagicMock(TaskQueueManager)
+        mock_tqm._final_q = Queue.Queue()
+        mock_tqm._options = MagicMock(step=False, diff=False)
+        mock_tqm._notified_handlers = {}
+        mock_tqm._listening_handlers = {}
+        mock_tqm._terminated = False
+        mock_tqm._failed_hosts = {}
+        mock_tqm._unreachable_hosts = {}
+        mock_tqm._workers = []
+        mock_tqm.get_loader.return_value = fake_loader
+        mock_tqm.get_variable_manager.return_value = mock_var_manager
+
+        include_parent = MagicMock()
+
+        include_task = MagicMock()
+        include_task.action = 'include'
+        include_task.name = 'include some tasks'
+        include_task._role = None
+        include_task.run_once = False
+        include_task.any_errors_fatal = False
+        include_task.ignore_errors = False
+        include_task._parent = include_parent
+
+        include_result = MagicMock()
+        include_result._task = include_task
+        include_result._host = host1
+        include_result.is_failed.return_value = False
+        include_result.is_unreachable.return_value = False
+
+        # only host1 ran the include, so host2 should get a noop block
+        included_file = MagicMock()
+        included_file._filename = 'included.yml'
+        included_file._task = include_task
+        included_file._hosts = [host1]
+        mock_process_include_results.side_effect = [[included_file], []]
+
+        new_block = MagicMock()
+        new_block.block = [MagicMock()]
+        new_block.always = []
+        new_block.rescue = []
+
+        mock_iterator = MagicMock()
+        mock_iterator._play.max_fail_percentage = None
+
+        strategy = StrategyModule(tqm=mock_tqm)
+        try:
+            strategy.get_hosts_left = MagicMock(return_value=[host1, host2])
+            # host2 is the last host and has no task when the include is processed
+            strategy._get_next_task_lockstep = MagicMock(side_effect=[
+                [(host1, include_task), (host2, None)],
+                [(host1, None), (host2, None)],
+            ])
+            strategy.add_tqm_variables = MagicMock()
+            strategy._queue_task = MagicMock()
+            strategy._process_pending_results = MagicMock(return_value=[include_result])
+            strategy._load_included_file = MagicMock(return_value=[new_block])
+
+            strategy.run(iterator=mock_iterator, play_context=MagicMock())
+        finally:
+            strategy.cleanup()
+
+        added = dict((args[0], args[1]) for (args, kwargs) in mock_iterator.add_tasks.call_args_list)
+        self.assertEqual(added[host1], [new_block.filter_tagged_tasks.return_value])
+
+        noop_block = added[host2][0]
+        self.assertIsInstance(noop_block, Block)
+        self.assertIs(noop_block._parent, include_parent)
+        self.assertEqual(len(noop_block.block), 1)
+        self.assertEqual(noop_block.block[0].args['_raw_params'], 'noop')
@@ -132,6 +132,24 @@ class TestVariableManager(unittest.TestCase):
         v = VariableManager(loader=fake_loader, inventory=mock_inventory)
         self.assertEqual(v.get_vars(task=mock_task, use_cache=False).get("foo"), "bar")
 
+    def test_variable_manager_set_host_facts(self):
+        fake_loader = DictDataLoader({})
+
+        mock_host = MagicMock()
+        mock_host.name = 'host1'
+
+        v = VariableManager(loader=fake_loader, inventory=MagicMock())
+        # the fallback used when the fact cache plugin cannot be loaded
+        v._fact_cache = dict()
+
+        v.set_host_facts(mock_host, dict(a=1, b=2))
+        v.set_host_facts(mock_host, dict(b=3, c=4))
+        self.assertEqual(v._fact_cache['host1'], dict(a=1, b=3, c=4))
+
+        v.set_nonpersistent_facts(mock_host, dict(d=5))
+        v.set_nonpersistent_facts(mock_host, dict(e=6))
+        self.assertEqual(v._nonpersistent_fact_cache['host1'], dict(d=5, e=6))
+
     @patch('ansible.playbook.role.definition.unfrackpath', mock_unfrackpath_noop)
     def test_variable_manager_precedence(self):
         # FIXME: this needs to be redone as dataloader is not the automatic source of data anymore